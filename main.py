@@ -1,8 +1,20 @@
 import sys
 import os
-import argparse
-from smolcc import create_agent
-from smolcc.agent import refresh_agent_context
+import signal
+import asyncio
+import atexit
+import threading
+import contextlib
+
+# readline gives input() line editing, history and fast paste handling;
+# it isn't available on Windows
+try:
+    import readline
+except ImportError:
+    readline = None
+
+HISTORY_FILE = os.path.expanduser("~/.smolcc_history")
+HISTORY_LENGTH = 1000
 
 def print_welcome():
     """Print welcome message with usage information."""
@@ -35,6 +47,7 @@ def print_welcome():
     print("🔧 COMMAND LINE OPTIONS:")
     print("  -i, --interactive    Start interactive mode for multiple queries")
     print("  --cwd PATH          Set the working directory for the agent")
+    print("  -v, --verbose       Show tool loading and agent refresh details")
     print("  -h, --help          Show detailed help message")
     print()
     print("🚀 To get started, try: python main.py -i")
@@ -43,8 +56,71 @@ def print_welcome():
 def main():
     """
     Main entry point for SmolCC.
+    Runs the async entry point on a fresh event loop.
+    """
+    # Show welcome message if no arguments are provided at all, before any
+    # argument parsing or agent setup happens
+    if len(sys.argv) == 1:
+        print_welcome()
+        return
+    
+    try:
+        asyncio.run(amain())
+    except KeyboardInterrupt:
+        pass
+
+async def run_in_thread(func, *args):
+    """
+    Run a blocking call in a daemon thread and await its result.
+    
+    Unlike asyncio.to_thread, a daemon thread doesn't keep the process alive
+    at exit, so Ctrl+C ends SmolCC even while the agent is still running.
+    Don't use it for reading the prompt: CPython won't finish shutting down
+    while any thread is blocked in input() on a terminal.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def worker():
+        try:
+            outcome = (func(*args), None)
+        except BaseException as e:
+            outcome = (None, e)
+        
+        def resolve():
+            if future.done():
+                return
+            result, error = outcome
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        
+        try:
+            loop.call_soon_threadsafe(resolve)
+        except RuntimeError:
+            # The event loop has already been closed
+            pass
+    
+    threading.Thread(target=worker, daemon=True).start()
+    return await future
+
+async def run_agent(agent, query):
+    """Run the agent in a worker thread so the event loop stays responsive."""
+    try:
+        return await run_in_thread(agent.run, query)
+    except asyncio.CancelledError:
+        # Stop the agent at its next step so the worker thread can finish
+        agent.interrupt()
+        raise
+
+async def amain():
+    """
+    Async entry point for SmolCC.
     Handles command line arguments and runs the agent.
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="SmolCC - A lightweight code assistant with tools",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -61,31 +137,34 @@ For more information, visit: https://github.com/aniemerg/smolcc
     parser.add_argument("-i", "--interactive", action="store_true", 
                         help="Run in interactive mode (prompt for queries)")
     parser.add_argument("--cwd", help="Set the working directory for the agent")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Show tool loading and agent refresh details")
     
     args = parser.parse_args()
     
-    # Show welcome message if no arguments are provided at all
-    if len(sys.argv) == 1:
-        print_welcome()
-        return
-    
-    # Set the working directory if provided
-    working_dir = args.cwd if args.cwd else os.getcwd()
-    
-    # Actually change to the working directory if specified
-    if args.cwd:
-        try:
-            os.chdir(working_dir)
-            print(f"📁 Changed to working directory: {working_dir}")
-        except (FileNotFoundError, PermissionError) as e:
-            print(f"❌ Error: Cannot change to directory '{working_dir}': {e}")
-            return
-    
-    # Create the agent with the appropriate working directory
-    print("🔧 Initializing SmolCC agent...")
-    agent = create_agent(os.getcwd()) # Use os.getcwd() as we've already chdir'd
-    print(f"📁 Working directory: {os.getcwd()}")
-    print()
+    # Agent setup is synchronous, so let Ctrl+C interrupt it directly
+    with raise_on_interrupt():
+        # Importing smolcc loads the environment and the agent dependencies,
+        # so defer it until there is a query to answer
+        from smolcc import create_agent
+        
+        # Set the working directory if provided
+        working_dir = args.cwd if args.cwd else os.getcwd()
+        
+        # Actually change to the working directory if specified
+        if args.cwd:
+            try:
+                os.chdir(working_dir)
+                print(f"📁 Changed to working directory: {working_dir}")
+            except (FileNotFoundError, PermissionError) as e:
+                print(f"❌ Error: Cannot change to directory '{working_dir}': {e}")
+                return
+        
+        # Create the agent with the appropriate working directory
+        print("🔧 Initializing SmolCC agent...")
+        agent = create_agent(os.getcwd(), verbose=args.verbose) # Use os.getcwd() as we've already chdir'd
+        print(f"📁 Working directory: {os.getcwd()}")
+        print()
     
     # Handle the query based on arguments
     if args.query:
@@ -93,38 +172,88 @@ For more information, visit: https://github.com/aniemerg/smolcc
         print(f"❓ Query: {query}")
         print("🤔 Processing...")
         print()
-        result = agent.run(query)
+        result = await run_agent(agent, query)
         print("📋 Response:")
         print(result)
     else:
         # If no query is provided, default to interactive mode.
         # This covers `main.py -i` and `main.py --cwd /some/path`.
-        run_interactive_mode(agent)
+        await run_interactive_mode(agent, verbose=args.verbose)
 
-def recreate_agent_with_cwd(new_cwd, current_agent=None):
+def recreate_agent_with_cwd(new_cwd, current_agent=None, verbose=False):
     """Recreate the agent with a new working directory and updated context."""
+    from smolcc.agent import create_agent, refresh_agent_context
+    
     try:
         os.chdir(new_cwd)
         print(f"📁 Changed to working directory: {os.getcwd()}")
         
         # Try to use the more efficient refresh method if agent is provided
         if current_agent is not None:
-            print("🔄 Refreshing agent context...")
+            if verbose:
+                print("🔄 Refreshing agent context...")
             updated_agent = refresh_agent_context(current_agent, os.getcwd())
-            print("✅ Agent context refreshed successfully")
+            if verbose:
+                print("✅ Agent context refreshed successfully")
             return updated_agent
         else:
             # Fallback to full recreation
-            print("🔄 Creating new agent with directory context...")
-            agent = create_agent(os.getcwd())
-            print("✅ Agent context updated successfully")
+            if verbose:
+                print("🔄 Creating new agent with directory context...")
+            agent = create_agent(os.getcwd(), verbose=verbose)
+            if verbose:
+                print("✅ Agent context updated successfully")
             return agent
     except (FileNotFoundError, PermissionError) as e:
         print(f"❌ Error: Cannot change to directory '{new_cwd}': {e}")
         return None
 
-def run_interactive_mode(agent):
+def setup_readline_history():
+    """
+    Load the interactive prompt history and save it again on exit.
+    
+    readline only behaves when input() runs on the main thread (see
+    run_interactive_mode); in a blocked worker thread it can leave the terminal with
+    echo and line buffering disabled after exit.
+    """
+    if readline is None:
+        return
+    
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    
+    def save_history():
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+    
+    atexit.register(save_history)
+
+@contextlib.contextmanager
+def raise_on_interrupt():
+    """
+    Make Ctrl+C raise KeyboardInterrupt at once while running synchronous code.
+    
+    asyncio.run replaces the SIGINT handler with one that only cancels the main
+    task, which has no effect until the task next awaits: input() would wait
+    for Enter and a slow `cd` refresh would run to completion. The default
+    handler is installed for the synchronous steps and asyncio's handler is
+    put back for the awaits.
+    """
+    previous_handler = signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+async def run_interactive_mode(agent, verbose=False):
     """Run SmolCC in interactive mode, prompting for queries."""
+    setup_readline_history()
+    
     print("🚀 SmolCC Interactive Mode")
     print("=" * 40)
     print("💬 Enter your queries and I'll help you with:")
@@ -142,42 +271,46 @@ def run_interactive_mode(agent):
     
     while True:
         try:
-            query = input("\n🤖 SmolCC> ")
-            if query.lower() in ("exit", "quit"):
-                print("👋 Goodbye! Thanks for using SmolCC!")
-                break
-            
-            if not query.strip():
-                continue
-            
-            # Handle special built-in commands
-            if query.lower() == "help":
-                print_help_commands()
-                continue
-            
-            # Handle cd command to change working directory
-            if query.strip().lower().startswith("cd "):
-                new_path = query.strip()[3:].strip()
-                if new_path:
-                    # Handle relative paths and expand ~
-                    new_path = os.path.expanduser(new_path)
-                    if not os.path.isabs(new_path):
-                        new_path = os.path.join(os.getcwd(), new_path)
-                    new_path = os.path.normpath(new_path)
-                    
-                    new_agent = recreate_agent_with_cwd(new_path, agent)
-                    if new_agent is not None:
-                        agent = new_agent
-                else:
-                    print("❌ Usage: cd <directory_path>")
-                continue
+            # Nothing else runs on the event loop while waiting for a query,
+            # so the prompt and built-in commands run on the main thread;
+            # only the agent is offloaded
+            with raise_on_interrupt():
+                query = input("\n🤖 SmolCC> ")
+                if query.lower() in ("exit", "quit"):
+                    print("👋 Goodbye! Thanks for using SmolCC!")
+                    break
+                
+                if not query.strip():
+                    continue
+                
+                # Handle special built-in commands
+                if query.lower() == "help":
+                    print_help_commands()
+                    continue
+                
+                # Handle cd command to change working directory
+                if query.strip().lower().startswith("cd "):
+                    new_path = query.strip()[3:].strip()
+                    if new_path:
+                        # Handle relative paths and expand ~
+                        new_path = os.path.expanduser(new_path)
+                        if not os.path.isabs(new_path):
+                            new_path = os.path.join(os.getcwd(), new_path)
+                        new_path = os.path.normpath(new_path)
+                        
+                        new_agent = recreate_agent_with_cwd(new_path, agent, verbose)
+                        if new_agent is not None:
+                            agent = new_agent
+                    else:
+                        print("❌ Usage: cd <directory_path>")
+                    continue
                 
             print("🤔 Processing...")
-            result = agent.run(query)
+            result = await run_agent(agent, query)
             print("📋 Response:")
             print(result)
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
             print("\n👋 Goodbye! Thanks for using SmolCC!")
             break
         except Exception as e:
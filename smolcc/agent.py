@@ -1,10 +1,15 @@
 import os
+import sys
+import ast
+import shutil
+import functools
 import platform
+import threading
 import importlib.util
 from typing import Optional
 from dotenv import load_dotenv
 
-from smolagents import CodeAgent, ToolCallingAgent, LiteLLMModel
+from smolagents import CodeAgent, ToolCallingAgent, LiteLLMModel, Tool
 
 # Import system prompt utilities
 from smolcc.system_prompt import get_system_prompt
@@ -12,76 +17,222 @@ from smolcc.system_prompt import get_system_prompt
 # Initialize environment variables
 load_dotenv()
 
+# LiteLLMModel shared by every agent in this process; see create_agent
+_model_singleton = None
+
+# Get the tools directory path
+TOOLS_DIR = os.path.join(os.path.dirname(__file__), "tools")
+
+# List of tools to try importing (filename, tool_instance_name)
+TOOL_CONFIGS = [
+    ("cd_tool.py", "cd_tool"),
+    ("edit_tool.py", "file_edit_tool"),
+    ("glob_tool.py", "glob_tool"),
+    ("grep_tool.py", "grep_tool"),
+    ("ls_tool.py", "ls_tool"),
+    ("replace_tool.py", "write_tool"),
+    ("view_tool.py", "view_tool"),
+    ("user_input_tool.py", "user_input_tool"),
+]
+
+# Executables that tools start when created (tool_instance_name -> executable);
+# a lazy tool can't fail at import, so these are checked before registering it
+TOOL_EXECUTABLES = {}
+
+# Add platform-specific shell tools
+if platform.system() == 'Windows':
+    # On Windows, use PowerShell tool
+    TOOL_CONFIGS.append(("powershell_tool.py", "powershell_tool"))
+    TOOL_EXECUTABLES["powershell_tool"] = "powershell.exe"
+    SHELL_TOOL_NOTE = "Note: Using PowerShell tool on Windows"
+else:
+    # On Unix-like systems, use bash tool
+    TOOL_CONFIGS.append(("bash_tool.py", "bash_tool"))
+    TOOL_EXECUTABLES["bash_tool"] = "/bin/bash"
+    SHELL_TOOL_NOTE = "Note: Using Bash tool on Unix-like system"
+
+# Resolve the tool files once; neither the platform nor the files change at runtime
+_TOOL_PATHS = tuple(
+    (os.path.join(TOOLS_DIR, filename), tool_name)
+    for filename, tool_name in TOOL_CONFIGS
+    if os.path.exists(os.path.join(TOOLS_DIR, filename))
+)
+_MISSING_TOOL_PATHS = tuple(
+    os.path.join(TOOLS_DIR, filename)
+    for filename, _ in TOOL_CONFIGS
+    if not os.path.exists(os.path.join(TOOLS_DIR, filename))
+)
+
+# Serializes tool imports so concurrent first uses don't execute a module twice
+_IMPORT_LOCK = threading.Lock()
+
 def import_tool_safely(module_path, tool_name):
     """Safely import a tool from a specific file path."""
-    try:
-        spec = importlib.util.spec_from_file_location(f"smolcc.tools.{tool_name}", module_path)
-        if spec is None:
+    # Key on the file name so the cache matches the real smolcc.tools modules
+    module_name = f"smolcc.tools.{os.path.splitext(os.path.basename(module_path))[0]}"
+    
+    with _IMPORT_LOCK:
+        # Reuse the module if it has already been imported
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return getattr(module, tool_name, None)
+        
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, module_path)
+            if spec is None:
+                return None
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            sys.modules[module_name] = module
+            return getattr(module, tool_name, None)
+        except Exception as e:
+            print(f"Warning: Could not import {tool_name} from {module_path}: {e}")
             return None
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return getattr(module, tool_name, None)
-    except Exception as e:
-        print(f"Warning: Could not import {tool_name} from {module_path}: {e}")
+
+def read_tool_schema(module_path, tool_name):
+    """Read a tool's name, description, inputs and output_type from its source without importing it."""
+    try:
+        with open(module_path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=module_path)
+    except (OSError, SyntaxError):
         return None
+    
+    # Find the class instantiated by the module-level `tool_name = ToolClass()` export
+    class_name = None
+    for node in tree.body:
+        if (isinstance(node, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == tool_name for t in node.targets)
+                and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Name)):
+            class_name = node.value.func.id
+    
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            schema = {}
+            for stmt in node.body:
+                if (isinstance(stmt, ast.Assign)
+                        and len(stmt.targets) == 1
+                        and isinstance(stmt.targets[0], ast.Name)
+                        and stmt.targets[0].id in LazyTool.SCHEMA_ATTRIBUTES):
+                    try:
+                        schema[stmt.targets[0].id] = ast.literal_eval(stmt.value)
+                    except ValueError:
+                        return None
+            if all(attr in schema for attr in LazyTool.SCHEMA_ATTRIBUTES):
+                return schema
+    return None
 
-def get_available_tools():
-    """Get all available tools for the current platform."""
+class LazyTool(Tool):
+    """
+    Proxy for a tool whose module is only imported the first time it is called.
+    
+    The agent only needs a tool's schema to register it, so the schema is read
+    statically and the real tool (and any shell session it starts) is created
+    on first use. Tools that start an executable are only built when it is
+    available (see TOOL_EXECUTABLES); a tool whose module still fails to
+    import stays registered, but every call raises without retrying the import.
+    """
+    
+    SCHEMA_ATTRIBUTES = ("name", "description", "inputs", "output_type")
+    skip_forward_signature_validation = True
+    
+    def __init__(self, module_path, tool_name, schema):
+        self.module_path = module_path
+        self.tool_name = tool_name
+        for attr in self.SCHEMA_ATTRIBUTES:
+            setattr(self, attr, schema[attr])
+        self._tool = None
+        self._load_failed = False
+        # The agent may run several tool calls in parallel threads, so the
+        # first-use import must only happen once
+        self._setup_lock = threading.Lock()
+        super().__init__()
+    
+    def setup(self):
+        """Import the underlying tool module."""
+        with self._setup_lock:
+            if self._tool is not None:
+                self.is_initialized = True
+                return
+            if not self._load_failed:
+                self._tool = import_tool_safely(self.module_path, self.tool_name)
+                self._load_failed = self._tool is None
+            if self._load_failed:
+                raise RuntimeError(f"Could not load tool {self.tool_name} from {self.module_path}")
+            self.is_initialized = True
+    
+    def forward(self, *args, **kwargs):
+        return self._tool(*args, **kwargs)
+
+def build_tool(tool_path, tool_name):
+    """Build a lazy proxy for a tool, importing it eagerly if its schema isn't static."""
+    # Don't offer the agent a tool whose executable can never be started
+    executable = TOOL_EXECUTABLES.get(tool_name)
+    if executable is not None and shutil.which(executable) is None:
+        print(f"Warning: Could not load {tool_name}: {executable} was not found")
+        return None
+    
+    schema = read_tool_schema(tool_path, tool_name)
+    if schema is not None:
+        return LazyTool(tool_path, tool_name, schema)
+    return import_tool_safely(tool_path, tool_name)
+
+def get_available_tools(verbose=False):
+    """Get all available tools for the current platform, printing load details if verbose."""
+    tools, report = _load_tools()
+    if verbose:
+        for line in report:
+            print(line)
+    return list(tools)
+
+@functools.lru_cache(maxsize=1)
+def _load_tools():
+    """
+    Load the platform's tools once; the tool list never changes at runtime.
+    
+    Returns the tools together with the load report lines, which are only
+    printed in verbose mode.
+    """
     tools = []
+    report = [SHELL_TOOL_NOTE]
     
-    # Get the tools directory path
-    tools_dir = os.path.join(os.path.dirname(__file__), "tools")
-    
-    # List of tools to try importing (filename, tool_instance_name)
-    tool_configs = [
-        ("cd_tool.py", "cd_tool"),
-        ("edit_tool.py", "file_edit_tool"),
-        ("glob_tool.py", "glob_tool"),
-        ("grep_tool.py", "grep_tool"),
-        ("ls_tool.py", "ls_tool"),
-        ("replace_tool.py", "write_tool"),
-        ("view_tool.py", "view_tool"),
-        ("user_input_tool.py", "user_input_tool"),
-    ]
-    
-    # Add platform-specific shell tools
-    if platform.system() == 'Windows':
-        # On Windows, use PowerShell tool
-        tool_configs.append(("powershell_tool.py", "powershell_tool"))
-        print("Note: Using PowerShell tool on Windows")
-    else:
-        # On Unix-like systems, use bash tool
-        tool_configs.append(("bash_tool.py", "bash_tool"))
-        print("Note: Using Bash tool on Unix-like system")
-    
-    for filename, tool_name in tool_configs:
-        tool_path = os.path.join(tools_dir, filename)
-        if os.path.exists(tool_path):
-            tool = import_tool_safely(tool_path, tool_name)
-            if tool is not None:
-                tools.append(tool)
-                print(f"✓ Loaded {tool_name}")
-            else:
-                print(f"✗ Failed to load {tool_name}")
+    for tool_path in _MISSING_TOOL_PATHS:
+        report.append(f"✗ Tool file not found: {tool_path}")
+    
+    for tool_path, tool_name in _TOOL_PATHS:
+        tool = build_tool(tool_path, tool_name)
+        if isinstance(tool, LazyTool):
+            # Registered from its schema; the module is imported on first use
+            tools.append(tool)
+            report.append(f"✓ Registered {tool_name}")
+        elif tool is not None:
+            tools.append(tool)
+            report.append(f"✓ Loaded {tool_name}")
         else:
-            print(f"✗ Tool file not found: {tool_path}")
+            report.append(f"✗ Failed to load {tool_name}")
     
-    return tools
+    return tuple(tools), tuple(report)
 
 def refresh_agent_context(agent, new_cwd=None):
-    """Refresh the agent's system prompt with updated directory context without full recreation."""
+    """
+    Refresh the agent's system prompt with updated directory context without full recreation.
+    
+    The LiteLLMModel and the agent's tools are reused as-is; only the system
+    prompt string the model sends with each completion is replaced.
+    """
     if new_cwd is None:
         new_cwd = os.getcwd()
     
     # Generate new system prompt with updated context
     new_system_prompt = get_system_prompt(new_cwd)
     
-    # Update the model's system prompt
-    agent.model.system = new_system_prompt
+    # LiteLLMModel keeps extra constructor arguments such as `system` in its
+    # kwargs and forwards them with every completion call
+    agent.model.kwargs["system"] = new_system_prompt
     
     return agent
 
-def create_agent(cwd=None):
+def create_agent(cwd=None, verbose=False):
     """Create a tool-calling agent with the system prompt."""
     if cwd is None:
         cwd = os.getcwd()
@@ -89,25 +240,34 @@ def create_agent(cwd=None):
     # Get the dynamic system prompt
     system_prompt = get_system_prompt(cwd)
     
-    # Create a new model with the system prompt
-    agent_model = LiteLLMModel(
-        model_id="deepseek/deepseek-chat",  # LiteLLM format for DeepSeek
-        api_key=os.getenv("DEEPSEEK_API_KEY"),
-        base_url="https://api.deepseek.com",
-        system=system_prompt
-    )
+    # Create the model once and reuse it, only swapping its system prompt
+    global _model_singleton
+    if _model_singleton is None:
+        _model_singleton = LiteLLMModel(
+            model_id="deepseek/deepseek-chat",  # LiteLLM format for DeepSeek
+            api_key=os.getenv("DEEPSEEK_API_KEY"),
+            base_url="https://api.deepseek.com",
+            system=system_prompt
+        )
+    else:
+        _model_singleton.kwargs["system"] = system_prompt
+    agent_model = _model_singleton
     
     # Get available tools for this platform
-    tools = get_available_tools()
+    tools = get_available_tools(verbose)
     
     if not tools:
         raise RuntimeError("No tools available! Check your tool imports.")
     
-    print(f"\nLoaded {len(tools)} tools successfully")
+    if verbose:
+        print(f"\nLoaded {len(tools)} tools successfully")
     
+    # Stream model output so tokens are rendered as they arrive instead of
+    # after the whole completion has been received
     agent = ToolCallingAgent(
         tools=tools,
-        model=agent_model
+        model=agent_model,
+        stream_outputs=True
     )
     
     return agent
@@ -3,6 +3,7 @@ import datetime
 import platform
 import json
 import subprocess
+import functools
 from pathlib import Path
 
 
@@ -65,11 +66,9 @@ def is_git_repo(path):
         return False
 
 
-def get_system_prompt(cwd=None):
-    """Generate the system prompt with dynamic values filled in."""
-    if cwd is None:
-        cwd = os.getcwd()
-    
+@functools.lru_cache(maxsize=1)
+def read_system_message_template():
+    """Read the system message template once; it doesn't change at runtime."""
     # The system message template is now in the same directory as this file
     template_path = os.path.join(os.path.dirname(__file__), 'system_message.txt')
     
@@ -87,6 +86,16 @@ def get_system_prompt(cwd=None):
         except Exception as e:
             raise RuntimeError(f"Could not read system_message.txt: {e}")
     
+    return system_message
+
+
+def get_system_prompt(cwd=None):
+    """Generate the system prompt with dynamic values filled in."""
+    if cwd is None:
+        cwd = os.getcwd()
+    
+    system_message = read_system_message_template()
+    
     # Get current date in format M/D/YYYY (Windows-compatible)
     today = datetime.datetime.now()
     if platform.system() == 'Windows':
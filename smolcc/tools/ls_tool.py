@@ -5,13 +5,16 @@ This tool lists files and directories in a given path.
 """
 
 import os
+import re
 import fnmatch
-from typing import List, Dict, Any, Optional, Set, Tuple
+from collections import deque
+from typing import List, Dict, Any, Optional, Pattern, Set, Tuple
 
 from smolagents import Tool
 
 # Constants
 MAX_FILES = 1000
+BANNED_NAMES = frozenset({'__pycache__', 'node_modules', '.git'})
 TRUNCATED_MESSAGE = f"There are more than {MAX_FILES} files in the repository. Use the LS tool (passing a specific path), Bash tool, and other tools to explore nested directories. The first {MAX_FILES} files and directories are included below:\n\n"
 
 
@@ -49,193 +52,122 @@ class LSTool(Tool):
         if not os.path.isdir(path):
             return f"Error: Path '{path}' is not a directory"
         
-        # Get the list of all paths in the directory
-        all_paths = self._list_directory(path, ignore or [])
+        # Translate the ignore patterns once into a single regex
+        ignore_regex = None
+        if ignore:
+            ignore_regex = re.compile('|'.join(
+                f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in ignore
+            ))
         
-        # Build tree structure from the paths
-        tree = self._create_file_tree(all_paths)
+        # Add absolute path at root level, ensuring it ends with / for consistency
+        root_path = path.rstrip(os.path.sep) + '/'
+        parts = [f"- {root_path}\n"]
+        
+        # Select the entries breadth-first, then emit tree lines in a single pass
+        children, truncated = self._list_directory(path, ignore_regex)
+        self._render_tree(children, path, parts)
         
         # Format the tree as a string
-        truncated = len(all_paths) >= MAX_FILES
         prefix = TRUNCATED_MESSAGE if truncated else ""
-        tree_output = self._print_tree(tree, path)
+        tree_output = ''.join(parts)
         
         # Return result with safety warning
         result = f"{prefix}{tree_output}"
         return result 
         
-    def _list_directory(self, initial_path: str, ignore_patterns: List[str]) -> List[str]:
+    def _list_directory(self, initial_path: str,
+                        ignore_regex: Optional[Pattern[str]]) -> Tuple[Dict[str, List[os.DirEntry]], bool]:
         """
-        Lists all files and directories using breadth-first traversal.
+        Lists all files and directories using breadth-first traversal, so that
+        shallow entries are kept over deeply nested ones when MAX_FILES is hit.
         
         Args:
             initial_path: The starting directory path
-            ignore_patterns: List of glob patterns to ignore
+            ignore_regex: Compiled regex of glob patterns to ignore, or None
             
         Returns:
-            List of relative paths (directories ending with /)
+            A mapping of directory path to its kept entries in sorted order,
+            and whether an entry had to be left out because of MAX_FILES
         """
-        results = []
-        queue = [initial_path]
+        children = {}
+        queue = deque([initial_path])
         file_count = 0
         
-        while queue and file_count < MAX_FILES:
-            path = queue.pop(0)  # Dequeue from left (FIFO)
-            
-            # Skip if this path should be filtered
-            if self._should_skip(path, ignore_patterns):
+        while queue:
+            dir_path = queue.popleft()
+            try:
+                # DirEntry caches the file type from the directory read itself
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except (PermissionError, FileNotFoundError, NotADirectoryError):
                 continue
-                
-            # Add this path to results (except the initial path)
-            if path != initial_path:
-                # Get relative path and normalize separators
-                rel_path = os.path.relpath(path, initial_path).replace(os.path.sep, '/')
-                # Ensure directories end with /
-                if os.path.isdir(path):
-                    if not rel_path.endswith('/'):
-                        rel_path += '/'
-                    results.append(rel_path)
-                else:
-                    results.append(rel_path)
-                    file_count += 1
             
-            # If it's a directory, add its children to the queue
-            if os.path.isdir(path):
-                try:
-                    # Get all entries in the directory
-                    entries = []
-                    for item in os.listdir(path):
-                        item_path = os.path.join(path, item)
-                        entries.append(item_path)
-                    
-                    # Sort entries alphabetically
-                    entries.sort()
-                    
-                    # Add entries to queue
-                    for item_path in entries:
-                        if not self._should_skip(item_path, ignore_patterns):
-                            queue.append(item_path)
-                except (PermissionError, FileNotFoundError):
+            kept = children[dir_path] = []
+            for entry in entries:
+                # Skip if this entry should be filtered
+                if self._should_skip(entry, ignore_regex):
                     continue
+                
+                # Stop as soon as an entry has to be left out; nothing else is read
+                if file_count == MAX_FILES:
+                    return children, True
+                
+                kept.append(entry)
+                if not entry.is_dir():
+                    file_count += 1
+                elif not entry.is_symlink():
+                    # Symlinked directories are shown but not descended into,
+                    # so link cycles can't repeat entries
+                    queue.append(entry.path)
         
-        # Sort results alphabetically
-        results.sort()
-        return results
+        return children, False
+    
+    def _render_tree(self, children: Dict[str, List[os.DirEntry]], dir_path: str,
+                     parts: List[str], prefix: str = '  ') -> None:
+        """
+        Appends one formatted tree line per kept entry to parts, depth-first.
         
-    def _should_skip(self, path: str, ignore_patterns: List[str]) -> bool:
+        Args:
+            children: Mapping of directory path to its kept entries
+            dir_path: The directory whose entries are rendered
+            parts: List the formatted tree lines are appended to
+            prefix: Indentation prefix for this directory's entries
+        """
+        for entry in children.get(dir_path, ()):
+            # Ensure directories end with / and render their entries below them
+            if entry.is_dir():
+                parts.append(f"{prefix}- {entry.name}/\n")
+                self._render_tree(children, entry.path, parts, prefix + "  ")
+            else:
+                parts.append(f"{prefix}- {entry.name}\n")
+        
+    def _should_skip(self, entry: os.DirEntry, ignore_regex: Optional[Pattern[str]]) -> bool:
         """
-        Determines if a path should be skipped.
+        Determines if a directory entry should be skipped.
         
         Args:
-            path: Path to check
-            ignore_patterns: List of glob patterns to ignore
+            entry: Directory entry to check
+            ignore_regex: Compiled regex of glob patterns to ignore, or None
             
         Returns:
-            True if the path should be skipped, False otherwise
+            True if the entry should be skipped, False otherwise
         """
-        basename = os.path.basename(path.rstrip(os.path.sep))
+        basename = entry.name
         
         # Skip hidden files and directories
-        if basename.startswith('.') and basename != '.':
+        if basename.startswith('.'):
             return True
             
-        # Skip __pycache__ directories
-        if basename == '__pycache__' or '__pycache__/' in path.replace(os.path.sep, '/'):
+        # Skip __pycache__, node_modules and .git directories; anything below
+        # them is never reached because skipped directories aren't traversed
+        if basename in BANNED_NAMES:
             return True
             
         # Skip paths matching ignore patterns
-        if any(fnmatch.fnmatch(path, pattern) for pattern in ignore_patterns):
+        if ignore_regex is not None and ignore_regex.match(os.path.normcase(entry.path)):
             return True
             
         return False
-    
-    def _create_file_tree(self, sorted_paths: List[str]) -> List[Dict]:
-        """
-        Converts a flat list of paths into a tree structure.
-        
-        Args:
-            sorted_paths: Alphabetically sorted list of relative paths
-            
-        Returns:
-            List of tree nodes representing the directory structure
-        """
-        root = []
-        
-        for path in sorted_paths:
-            parts = path.split('/')
-            current_level = root
-            current_path = ''
-            
-            for i, part in enumerate(parts):
-                if not part:  # Skip empty parts from trailing slashes
-                    continue
-                    
-                current_path = f"{current_path}/{part}" if current_path else part
-                is_directory = i < len(parts) - 1 or path.endswith('/')
-                
-                # Check if this node already exists
-                existing_node = None
-                for node in current_level:
-                    if node['name'] == part:
-                        existing_node = node
-                        break
-                        
-                if existing_node:
-                    # Move to existing node's children
-                    current_level = existing_node.get('children', [])
-                else:
-                    # Create new node
-                    new_node = {
-                        'name': part,
-                        'path': current_path,
-                        'type': 'directory' if is_directory else 'file'
-                    }
-                    
-                    if is_directory:
-                        new_node['children'] = []
-                        
-                    current_level.append(new_node)
-                    current_level = new_node.get('children', [])
-        
-        return root
-    
-    def _print_tree(self, tree: List[Dict], root_path: str, level: int = 0, prefix: str = '') -> str:
-        """
-        Formats a tree structure into a string representation.
-        
-        Args:
-            tree: The tree structure to print
-            root_path: The absolute path to the root directory
-            level: Current indentation level
-            prefix: Prefix string for indentation
-            
-        Returns:
-            Formatted string representation of the tree
-        """
-        result = ""
-        
-        # Add absolute path at root level
-        if level == 0:
-            # Ensure root path ends with / for consistency
-            root_path = root_path.rstrip(os.path.sep) + '/'
-            result += f"- {root_path}\n"
-            prefix = "  "
-        
-        for node in tree:
-            # Add the current node with proper formatting
-            node_suffix = "/" if node['type'] == 'directory' else ""
-            result += f"{prefix}- {node['name']}{node_suffix}\n"
-            
-            # Process children recursively if this is a directory
-            if node.get('children'):
-                result += self._print_tree(
-                    node['children'],
-                    root_path,
-                    level + 1,
-                    prefix + "  "
-                )
-        
-        return result
 
 
 # Export the tool as an instance that can be directly used
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the interactive prompt in main.py.
+
+These tests run the interactive loop in a pseudo-terminal to verify that
+Ctrl+C at the prompt or during a built-in command exits immediately, and that
+readline leaves the terminal usable afterwards.
+"""
+
+import os
+import sys
+import time
+import select
+import unittest
+
+# Constants
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+GOODBYE = b"Goodbye"
+# Runs the interactive loop without an agent, a history file or a real `cd`
+INTERACTIVE_SCRIPT = """
+import asyncio
+import time
+import main
+
+def slow_recreate_agent_with_cwd(new_cwd, current_agent=None, verbose=False):
+    print("refreshing context", flush=True)
+    time.sleep(10)
+    return current_agent
+
+main.setup_readline_history = lambda: None
+main.recreate_agent_with_cwd = slow_recreate_agent_with_cwd
+asyncio.run(main.run_interactive_mode(None))
+"""
+
+
+@unittest.skipIf(sys.platform == "win32", "pseudo-terminals are not available on Windows")
+class InteractivePromptTests(unittest.TestCase):
+    """Tests for Ctrl+C handling in interactive mode."""
+
+    def setUp(self):
+        import pty
+
+        self.pid, self.fd = pty.fork()
+        if self.pid == 0:
+            os.chdir(PROJECT_ROOT)
+            os.execv(sys.executable, [sys.executable, "-c", INTERACTIVE_SCRIPT])
+
+        self.exited = False
+        self.assertIn(b"SmolCC> ", self._read_until(b"SmolCC> ", 30))
+        # Give readline time to set up the terminal after printing the prompt
+        time.sleep(0.5)
+
+    def tearDown(self):
+        if not self.exited:
+            os.kill(self.pid, 9)
+            os.waitpid(self.pid, 0)
+        os.close(self.fd)
+
+    def _read_until(self, token: bytes, timeout: float) -> bytes:
+        """Read from the pseudo-terminal until token appears or the timeout expires."""
+        output = b""
+        deadline = time.time() + timeout
+        while token not in output and time.time() < deadline:
+            ready, _, _ = select.select([self.fd], [], [], 0.1)
+            if ready:
+                try:
+                    data = os.read(self.fd, 1024)
+                except OSError:
+                    break
+                if not data:
+                    break
+                output += data
+        return output
+
+    def _assert_exits(self, timeout: float) -> None:
+        """Assert that the child process exits within the timeout."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if os.waitpid(self.pid, os.WNOHANG)[0]:
+                self.exited = True
+                break
+            time.sleep(0.1)
+        self.assertTrue(self.exited, "Process did not exit after Ctrl+C")
+
+    def test_ctrl_c_at_prompt_exits(self):
+        """Test that Ctrl+C at the prompt exits without waiting for Enter."""
+        import termios
+
+        os.write(self.fd, b"\x03")
+        self.assertIn(GOODBYE, self._read_until(GOODBYE, 10))
+
+        # readline must have restored echo and line buffering
+        local_flags = termios.tcgetattr(self.fd)[3]
+        self.assertTrue(local_flags & termios.ECHO, "Terminal echo was left disabled")
+        self.assertTrue(local_flags & termios.ICANON, "Terminal canonical mode was left disabled")
+
+        self._assert_exits(10)
+
+    def test_ctrl_c_during_cd_exits(self):
+        """Test that Ctrl+C during a slow built-in command exits without waiting for it."""
+        os.write(self.fd, b"cd /\r")
+        self.assertIn(b"refreshing context", self._read_until(b"refreshing context", 10))
+
+        os.write(self.fd, b"\x03")
+        # The slow command sleeps for 10 seconds; the exit must not wait for it
+        output = self._read_until(GOODBYE, 3)
+        self.assertIn(GOODBYE, output)
+        self.assertNotIn(b"SmolCC> ", output)
+        self._assert_exits(3)
+
+
+if __name__ == "__main__":
+    unittest.main()
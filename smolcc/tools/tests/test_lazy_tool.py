@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit tests for lazy tool loading in smolcc.agent.
+
+These tests verify that tool schemas are read without importing the tool
+module, that non-literal schemas fall back to an eager import, and that the
+real tool is imported exactly once on first use.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import textwrap
+import threading
+import unittest
+from unittest import mock
+
+from smolcc import agent as agent_module
+from smolcc.agent import LazyTool, build_tool, read_tool_schema
+from smolcc.tools.ls_tool import LSTool
+
+# Constants
+TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Minimal tool module with a static schema
+TOOL_MODULE_TEMPLATE = '''
+from smolagents import Tool
+
+SUFFIX = " tool"
+
+
+class EchoTool(Tool):
+    name = "Echo"
+    description = {description}
+    inputs = {{
+        "text": {{"type": "string", "description": "Text to echo"}}
+    }}
+    output_type = "string"
+
+    def forward(self, text: str) -> str:
+        return text
+
+
+echo_tool = EchoTool()
+'''
+
+
+class LazyToolTests(unittest.TestCase):
+    """Tests for read_tool_schema, build_tool and LazyTool."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.module_names = []
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+        for module_name in self.module_names:
+            sys.modules.pop(module_name, None)
+
+    def _write_tool_module(self, filename: str, description: str = '"Echo some text"') -> str:
+        """Write a tool module to the temp directory and return its path."""
+        module_path = os.path.join(self.temp_dir, filename)
+        with open(module_path, "w", encoding="utf-8") as f:
+            f.write(textwrap.dedent(TOOL_MODULE_TEMPLATE.format(description=description)))
+        self.module_names.append(f"smolcc.tools.{os.path.splitext(filename)[0]}")
+        return module_path
+
+    def test_read_static_schema(self):
+        """Test that a literal schema is read from the source file."""
+        schema = read_tool_schema(os.path.join(TOOLS_DIR, "ls_tool.py"), "ls_tool")
+        self.assertEqual(schema["name"], LSTool.name)
+        self.assertEqual(schema["description"], LSTool.description)
+        self.assertEqual(schema["inputs"], LSTool.inputs)
+        self.assertEqual(schema["output_type"], LSTool.output_type)
+
+    def test_non_literal_schema_falls_back_to_import(self):
+        """Test that a schema built from expressions is imported eagerly."""
+        module_path = self._write_tool_module("lazy_test_dynamic_tool.py", '"Echo" + SUFFIX')
+        self.assertIsNone(read_tool_schema(module_path, "echo_tool"))
+
+        tool = build_tool(module_path, "echo_tool")
+        self.assertNotIsInstance(tool, LazyTool)
+        self.assertEqual(tool.description, "Echo tool")
+
+    def test_first_call_imports_once(self):
+        """Test that the module is imported on first call, once, even from concurrent calls."""
+        module_path = self._write_tool_module("lazy_test_echo_tool.py")
+        module_name = "smolcc.tools.lazy_test_echo_tool"
+
+        tool = build_tool(module_path, "echo_tool")
+        self.assertIsInstance(tool, LazyTool)
+        self.assertNotIn(module_name, sys.modules)
+
+        with mock.patch.object(
+            agent_module, "import_tool_safely", wraps=agent_module.import_tool_safely
+        ) as import_mock:
+            threads = [
+                threading.Thread(target=tool, kwargs={"text": "hi"}) for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(tool(text="hello"), "hello")
+
+        self.assertEqual(import_mock.call_count, 1)
+        self.assertIn(module_name, sys.modules)
+
+    def test_missing_executable_is_not_registered(self):
+        """Test that a tool whose executable is missing isn't built or imported."""
+        module_path = self._write_tool_module("lazy_test_shell_tool.py")
+
+        with mock.patch.dict(agent_module.TOOL_EXECUTABLES, {"echo_tool": "smolcc-missing-executable"}), \
+                mock.patch.object(agent_module, "import_tool_safely") as import_mock, \
+                mock.patch("builtins.print"):
+            self.assertIsNone(build_tool(module_path, "echo_tool"))
+        import_mock.assert_not_called()
+
+        with mock.patch.dict(agent_module.TOOL_EXECUTABLES, {"echo_tool": sys.executable}):
+            self.assertIsInstance(build_tool(module_path, "echo_tool"), LazyTool)
+
+    def test_failed_import_is_not_retried(self):
+        """Test that a tool whose import fails raises on every call without re-importing."""
+        module_path = self._write_tool_module("lazy_test_failing_tool.py")
+        tool = build_tool(module_path, "echo_tool")
+
+        with mock.patch.object(agent_module, "import_tool_safely", return_value=None) as import_mock:
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    tool(text="hi")
+
+        self.assertEqual(import_mock.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
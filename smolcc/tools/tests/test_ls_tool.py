@@ -7,8 +7,11 @@ for standard inputs, effectively "locking in" the current behavior.
 """
 
 import os
+import shutil
+import tempfile
 import unittest
 import re
+from unittest import mock
 from typing import Dict, Any, List
 
 from smolcc.tools.ls_tool import ls_tool
@@ -119,6 +122,80 @@ class LSToolTests(unittest.TestCase):
         result = ls_tool.forward(**test_data["inputs"])
         self._verify_ls_results(result, test_data["expected_files"])
 
+    def test_tree_structure(self):
+        """Test that nested entries are indented under their parent directory."""
+        result = ls_tool.forward(path=os.path.join(TEST_DATA_DIR, "subfolder1"))
+        root_path = os.path.join(TEST_DATA_DIR, "subfolder1").rstrip(os.path.sep) + "/"
+        self.assertEqual(
+            result,
+            f"- {root_path}\n"
+            "  - subfolder2/\n"
+            "    - test_config.yml\n"
+            "  - test_component.jsx\n"
+            "  - test_file3.txt\n"
+        )
+
+    def test_symlinked_directory(self):
+        """Test that a symlinked directory is shown as a directory but not descended into."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            os.makedirs(os.path.join(temp_dir, "target"))
+            open(os.path.join(temp_dir, "target", "inner.txt"), "w").close()
+            try:
+                os.symlink(os.path.join(temp_dir, "target"), os.path.join(temp_dir, "link"),
+                           target_is_directory=True)
+            except (OSError, NotImplementedError):
+                self.skipTest("Symlinks are not supported here")
+
+            result = ls_tool.forward(path=temp_dir)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        self.assertEqual(
+            result,
+            f"- {temp_dir}/\n"
+            "  - link/\n"
+            "  - target/\n"
+            "    - inner.txt\n"
+        )
+
+    def test_truncation(self):
+        """Test that the listing is only marked truncated when files are left out."""
+        # testdata contains 9 files in total
+        with mock.patch("smolcc.tools.ls_tool.MAX_FILES", 9):
+            result = ls_tool.forward(path=TEST_DATA_DIR)
+        self.assertTrue(result.startswith(f"- {TEST_DATA_DIR}"))
+        self.assertIn("test_typescript_file.ts", result)
+
+        with mock.patch("smolcc.tools.ls_tool.MAX_FILES", 8):
+            result = ls_tool.forward(path=TEST_DATA_DIR)
+        self.assertTrue(result.startswith("There are more than"))
+        self.assertIn("test_typescript_file.ts", result)
+        self.assertNotIn("test_config.yml", result)
+
+    def test_truncation_keeps_shallow_entries(self):
+        """Test that a large nested directory doesn't crowd out top-level entries."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            os.makedirs(os.path.join(temp_dir, "assets"))
+            for i in range(20):
+                open(os.path.join(temp_dir, "assets", f"image{i:02d}.png"), "w").close()
+            os.makedirs(os.path.join(temp_dir, "src"))
+            open(os.path.join(temp_dir, "src", "main.py"), "w").close()
+            open(os.path.join(temp_dir, "setup.py"), "w").close()
+
+            with mock.patch("smolcc.tools.ls_tool.MAX_FILES", 10):
+                result = ls_tool.forward(path=temp_dir)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        self.assertTrue(result.startswith("There are more than"))
+        self.assertIn("  - setup.py\n", result)
+        self.assertIn("  - src/\n", result)
+        self.assertIn("    - image08.png\n", result)
+        self.assertNotIn("image09.png", result)
+        self.assertNotIn("main.py", result)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file